@@ -1,17 +1,32 @@
 """Command-line interface for Namecast."""
 
+from functools import cache
+
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from namecast.evaluator import BrandEvaluator, NamecastWorkflow
-from namecast.perception import analyze_two_pass
+# rich and the evaluator stack (anthropic, httpx, whois) are imported
+# lazily inside commands: `namecast --help` and --json output don't need
+# them, and deferring keeps CLI startup fast
+
+
+@cache
+def _get_console():
+    from rich.console import Console
+
+    return Console()
 
 
-console = Console()
+@cache
+def _get_evaluator():
+    """Shared BrandEvaluator: one instance per process.
+
+    The evaluation memo cache is keyed on the evaluator instance, so
+    sharing one lets repeat invocations in the same process (test
+    suites, REPL use) reuse earlier results.
+    """
+    from namecast.evaluator import BrandEvaluator
+
+    return BrandEvaluator()
 
 
 @click.group(invoke_without_command=True)
@@ -50,12 +65,16 @@ def find(description: str, ideas: tuple[str, ...], generate: int, evaluate: int,
 
         namecast find "AI coding assistant" -g 15 -e 8
     """
-    workflow = NamecastWorkflow()
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from namecast.evaluator import NamecastWorkflow
+
+    workflow = NamecastWorkflow(evaluator=_get_evaluator())
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=_get_console(),
         transient=True,
     ) as progress:
         progress.add_task("Running naming workflow...", total=None)
@@ -88,10 +107,12 @@ def eval(names: tuple[str, ...], mission: str | None, output_json: bool, compare
 
         namecast eval --compare Acme Globex Initech
     """
-    evaluator = BrandEvaluator()
+    evaluator = _get_evaluator()
 
     if compare and len(names) > 1:
-        results = [evaluator.evaluate(name, mission) for name in names]
+        # Batch API fans the evaluations out concurrently instead of
+        # paying each name's network latency in sequence
+        results = evaluator.evaluate_many(list(names), mission)
         if output_json:
             import json
             click.echo(json.dumps([r.to_dict() for r in results], indent=2, default=str))
@@ -126,10 +147,14 @@ def comport(name: str, product_description: str, output_json: bool):
 
         namecast comport Stripe "processes online payments"
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from namecast.perception import analyze_two_pass
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=_get_console(),
         transient=True,
     ) as progress:
         progress.add_task("Running two-pass evaluation...", total=None)
@@ -145,6 +170,10 @@ def comport(name: str, product_description: str, output_json: bool):
 
 def _print_comport_result(result):
     """Print the two-pass comport analysis."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _get_console()
     console.print()
 
     # Verdict panel with color based on result
@@ -209,6 +238,10 @@ def _print_comport_result(result):
 
 def _print_workflow_result(result):
     """Print the workflow result with rich formatting."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _get_console()
     console.print()
     console.print(Panel(
         f"[dim]{result.project_description}[/dim]",
@@ -285,6 +318,11 @@ def _print_workflow_result(result):
 
 def _print_result(result, mission: str | None):
     """Print a single evaluation result with rich formatting."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    console = _get_console()
     # Header
     score_color = "green" if result.overall_score >= 70 else "yellow" if result.overall_score >= 50 else "red"
     console.print()
@@ -337,6 +375,9 @@ def _print_result(result, mission: str | None):
 
 def _print_comparison(results):
     """Print side-by-side comparison of multiple names."""
+    from rich.table import Table
+
+    console = _get_console()
     console.print()
     console.print("[bold]Comparison[/bold]")
     console.print()
@@ -1,12 +1,34 @@
 """AI-powered brand perception forecasting with dynamic personas."""
 
 import json
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
-from anthropic import Anthropic
+from anthropic import Anthropic, APIConnectionError, RateLimitError
 
+_client: Optional[Anthropic] = None
+_client_lock = threading.Lock()
 
-@dataclass
+
+def _get_client() -> Anthropic:
+    """Return the shared Anthropic client, creating it on first use.
+
+    One client means one httpx connection pool, so back-to-back persona
+    calls reuse warm TLS connections instead of re-handshaking.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Anthropic()
+    return _client
+
+
+@dataclass(slots=True)
 class PersonaResponse:
     """Response from a single persona."""
     persona: str
@@ -21,7 +43,7 @@ class PersonaResponse:
     explanation: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ComportResponse:
     """Response from the 'does it comport?' follow-up question."""
     persona: str
@@ -31,7 +53,7 @@ class ComportResponse:
     explanation: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TwoPassResponse:
     """Combined response from both passes of persona evaluation."""
     persona: str
@@ -52,7 +74,7 @@ class TwoPassResponse:
     explanation: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PerceptionAnalysis:
     """Aggregated perception analysis from multiple personas."""
     evokes: str
@@ -66,7 +88,7 @@ class PerceptionAnalysis:
     mission_explanation: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TwoPassAnalysis:
     """Analysis from the two-pass 'what would you expect?' + 'does it comport?' evaluation."""
     name: str
@@ -85,6 +107,12 @@ class TwoPassAnalysis:
     verdict_explanation: str
 
 
+# Persona role-play is a low-complexity task; haiku answers it several
+# times cheaper and faster per call. Synthesis, persona generation, and
+# alignment judgments stay on the stronger model.
+PERSONA_MODEL = "claude-haiku-4-5-20251001"
+SYNTHESIS_MODEL = "claude-opus-4-5-20251101"
+
 # Default personas (used when no mission provided)
 DEFAULT_PERSONAS = [
     {
@@ -120,6 +148,142 @@ DEFAULT_PERSONAS = [
 ]
 
 
+# Constant per persona, so build it once instead of re-interpolating on
+# every query; a stable prefix also hashes identically for prompt caching
+_PERSONA_PREFIX_TEMPLATE = """You are {name}, a {age}-year-old {occupation}.
+Background: {background}
+
+You're being asked about a brand name for a company. Answer AS THIS PERSONA, based on their background and perspective."""
+
+
+def _persona_prefix(persona: dict) -> str:
+    """Return the persona's prompt prefix, building and caching it once."""
+    prefix = persona.get("prompt_prefix")
+    if prefix is None:
+        prefix = _PERSONA_PREFIX_TEMPLATE.format(**persona)
+        persona["prompt_prefix"] = prefix
+    return prefix
+
+
+for _persona in DEFAULT_PERSONAS:
+    _persona["prompt_prefix"] = _PERSONA_PREFIX_TEMPLATE.format(**_persona)
+del _persona
+
+
+# Forced tool invocation returns structured data directly instead of
+# JSON-in-prose, eliminating parse failures and narration tokens
+_PERCEPTION_TOOL = {
+    "name": "record_perception",
+    "description": "Record the persona's reaction to the brand name.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "evokes": {
+                "type": "string",
+                "description": "What the name makes you think of (1-2 sentences)",
+            },
+            "industry_guess": {
+                "type": "string",
+                "description": "What industry/type of company you would guess this is",
+            },
+            "would_trust": {
+                "type": "boolean",
+                "description": "Would you trust a company with this name?",
+            },
+            "memorable": {
+                "type": "boolean",
+                "description": "Is this name memorable to you?",
+            },
+            "memorability_score": {
+                "type": "integer",
+                "description": "1-10 rating of how memorable this name is",
+            },
+            "professionalism_score": {
+                "type": "integer",
+                "description": "1-10 rating of how professional/credible this sounds",
+            },
+            "explanation": {
+                "type": "string",
+                "description": "Brief explanation of your overall impression (2-3 sentences)",
+            },
+        },
+        "required": [
+            "evokes",
+            "industry_guess",
+            "would_trust",
+            "memorable",
+            "memorability_score",
+            "professionalism_score",
+            "explanation",
+        ],
+    },
+}
+
+_ALIGNMENT_TOOL = {
+    "name": "record_alignment",
+    "description": "Record how well the brand name aligns with the mission.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "score": {
+                "type": "number",
+                "description": "Alignment rating from 1-10",
+            },
+            "explanation": {
+                "type": "string",
+                "description": "Brief explanation (2-3 sentences)",
+            },
+        },
+        "required": ["score", "explanation"],
+    },
+}
+
+
+def _tool_input(response, tool_name: str) -> dict:
+    """Extract the input dict from a forced tool_use response."""
+    for block in response.content:
+        if block.type == "tool_use" and block.name == tool_name:
+            return block.input
+    raise ValueError(f"No {tool_name} tool call in response")
+
+
+# Transient API failures worth retrying; anything else fails fast
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError)
+
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _create_with_retry(client: Anthropic, attempts: int = 3, **kwargs):
+    """messages.create with exponential backoff on transient errors.
+
+    A dropped persona silently skews consensus_score, so rate limits and
+    connection blips get a couple of retries before we give up.
+    """
+    for attempt in range(attempts):
+        try:
+            return client.messages.create(**kwargs)
+        except _RETRYABLE_ERRORS:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.5 * 2**attempt)
+
+
+def _parse_json_object(text: str) -> dict:
+    """json.loads with a fallback that extracts the first {...} block.
+
+    Claude occasionally wraps the JSON in prose or markdown fences
+    despite instructions; salvage the object rather than dropping the
+    whole response.
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        match = _JSON_OBJECT_RE.search(text)
+        if match is None:
+            raise
+        return json.loads(match.group())
+
+
 def generate_dynamic_personas(mission: str, client: Anthropic) -> list[dict]:
     """Generate personas dynamically based on the company mission/description."""
 
@@ -151,7 +315,7 @@ Respond ONLY with valid JSON array."""
 
     try:
         response = client.messages.create(
-            model="claude-opus-4-5-20251101",
+            model=SYNTHESIS_MODEL,
             max_tokens=800,
             messages=[{"role": "user", "content": prompt}],
         )
@@ -182,7 +346,7 @@ def analyze_with_personas(
     If a mission is provided, generates dynamic personas tailored to the
     company's target audience. Otherwise uses default diverse personas.
     """
-    client = Anthropic()
+    client = _get_client()
 
     # Generate dynamic personas if mission provided, otherwise use defaults
     if mission:
@@ -190,35 +354,51 @@ def analyze_with_personas(
     else:
         personas = DEFAULT_PERSONAS[:num_personas]
 
-    responses = []
-    for persona in personas:
-        response = _query_persona(client, name, persona, mission)
-        if response:
-            responses.append(response)
+    # One batched call covers every persona - a single prefill+decode
+    # cycle instead of N. Fall back to concurrent per-persona queries
+    # if the batched response doesn't parse.
+    responses = _query_personas_batched(client, name, personas, mission)
+    if responses is None:
+        # Each persona query is an independent multi-second LLM round
+        # trip; fan them out so wall time is max-of-latencies
+        with ThreadPoolExecutor(max_workers=len(personas) or 1) as pool:
+            maybe_responses = pool.map(
+                lambda persona: _query_persona(client, name, persona, mission),
+                personas,
+            )
+        responses = [r for r in maybe_responses if r]
 
     return _aggregate_responses(responses, name, mission, client)
 
 
-def _query_persona(
+def _query_personas_batched(
     client: Anthropic,
     name: str,
-    persona: dict,
+    personas: list[dict],
     mission: Optional[str],
-) -> Optional[PersonaResponse]:
-    """Query a single persona about the brand name."""
+) -> Optional[list[PersonaResponse]]:
+    """Ask all personas about the name in a single Claude call.
 
+    Returns None if the response can't be parsed, so the caller can
+    fall back to per-persona queries.
+    """
     mission_context = ""
     if mission:
         mission_context = f"\n\nThe company's mission is: {mission}"
 
-    prompt = f"""You are {persona['name']}, a {persona['age']}-year-old {persona['occupation']}.
-Background: {persona['background']}
+    persona_list = "\n".join(
+        f"{i + 1}. {p['name']}, a {p['age']}-year-old {p['occupation']}. "
+        f"Background: {p['background']}"
+        for i, p in enumerate(personas)
+    )
+
+    prompt = f"""You will role-play {len(personas)} different personas reacting to a brand name. The personas:
 
-You're being asked about a brand name for a company. Answer AS THIS PERSONA, based on their background and perspective.
+{persona_list}
 
 Brand name: "{name}"{mission_context}
 
-Answer these questions from {persona['name']}'s perspective in JSON format:
+For EACH persona, in the order listed, answer from their perspective:
 {{
     "evokes": "What does this name make you think of? (1-2 sentences)",
     "industry_guess": "What industry/type of company would you guess this is?",
@@ -229,16 +409,88 @@ Answer these questions from {persona['name']}'s perspective in JSON format:
     "explanation": "Brief explanation of your overall impression (2-3 sentences)"
 }}
 
-Respond ONLY with valid JSON, no other text."""
+Respond with ONLY a JSON array of {len(personas)} objects, one per persona in order, no other text."""
 
     try:
         response = client.messages.create(
-            model="claude-opus-4-5-20251101",
-            max_tokens=500,
+            model=PERSONA_MODEL,
+            max_tokens=200 * len(personas),
             messages=[{"role": "user", "content": prompt}],
         )
 
-        result = json.loads(response.content[0].text)
+        text = response.content[0].text.strip()
+        # Handle markdown code blocks
+        if text.startswith("```"):
+            text = text.split("```")[1]
+            if text.startswith("json"):
+                text = text[4:]
+            text = text.strip()
+
+        results = json.loads(text)
+        if not isinstance(results, list) or len(results) != len(personas):
+            return None
+
+        return [
+            PersonaResponse(
+                persona=persona["name"],
+                age=persona["age"],
+                occupation=persona["occupation"],
+                evokes=result.get("evokes", ""),
+                industry_guess=result.get("industry_guess", ""),
+                would_trust=result.get("would_trust", True),
+                memorable=result.get("memorable", True),
+                memorability_score=result.get("memorability_score", 5),
+                professionalism_score=result.get("professionalism_score", 5),
+                explanation=result.get("explanation", ""),
+            )
+            for persona, result in zip(personas, results)
+        ]
+    except Exception as e:
+        print(f"Batched persona query failed, falling back to per-persona: {e}")
+        return None
+
+
+def _query_persona(
+    client: Anthropic,
+    name: str,
+    persona: dict,
+    mission: Optional[str],
+) -> Optional[PersonaResponse]:
+    """Query a single persona about the brand name."""
+
+    mission_context = ""
+    if mission:
+        mission_context = f"\n\nThe company's mission is: {mission}"
+
+    # Stable persona/mission prefix, cacheable across calls with the
+    # same persona and mission (~90% cheaper cached reads, no re-prefill)
+    prefix = _persona_prefix(persona) + mission_context
+
+    question = f"""Brand name: "{name}"
+
+Record your reaction from {persona['name']}'s perspective with the record_perception tool."""
+
+    try:
+        response = _create_with_retry(
+            client,
+            model=PERSONA_MODEL,
+            max_tokens=200,
+            tools=[_PERCEPTION_TOOL],
+            tool_choice={"type": "tool", "name": "record_perception"},
+            messages=[{
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": prefix,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {"type": "text", "text": question},
+                ],
+            }],
+        )
+
+        result = _tool_input(response, "record_perception")
 
         return PersonaResponse(
             persona=persona["name"],
@@ -277,17 +529,26 @@ def _aggregate_responses(
             avg_professionalism=5.0,
         )
 
-    # Collect all evocations and industries
-    all_evokes = [r.evokes for r in responses]
-    all_industries = [r.industry_guess for r in responses]
+    # Collect evocations/industries and tally scores in a single pass
+    all_evokes: list[str] = []
+    all_industries: list[str] = []
+    memorability_total = professionalism_total = 0
+    trust_count = memorable_count = 0
+    for r in responses:
+        all_evokes.append(r.evokes)
+        all_industries.append(r.industry_guess)
+        memorability_total += r.memorability_score
+        professionalism_total += r.professionalism_score
+        trust_count += r.would_trust
+        memorable_count += r.memorable
 
-    # Calculate averages
-    avg_memorability = sum(r.memorability_score for r in responses) / len(responses)
-    avg_professionalism = sum(r.professionalism_score for r in responses) / len(responses)
+    n = len(responses)
+    avg_memorability = memorability_total / n
+    avg_professionalism = professionalism_total / n
 
     # Calculate consensus
-    trust_rate = sum(1 for r in responses if r.would_trust) / len(responses)
-    memorable_rate = sum(1 for r in responses if r.memorable) / len(responses)
+    trust_rate = trust_count / n
+    memorable_rate = memorable_count / n
     consensus_score = (trust_rate + memorable_rate) / 2
 
     # Determine memorability category
@@ -306,17 +567,24 @@ def _aggregate_responses(
 Synthesize into a single 1-2 sentence summary of what this name evokes. Be specific and concrete."""
 
     try:
-        synthesis = client.messages.create(
-            model="claude-opus-4-5-20251101",
+        # Stream the synthesis so tokens are consumed as they arrive
+        # instead of waiting on the fully buffered response
+        chunks: list[str] = []
+        with client.messages.stream(
+            model=SYNTHESIS_MODEL,
             max_tokens=150,
             messages=[{"role": "user", "content": synthesis_prompt}],
-        )
-        evokes_summary = synthesis.content[0].text.strip()
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+        evokes_summary = "".join(chunks).strip()
     except Exception:
         evokes_summary = all_evokes[0] if all_evokes else "professional, modern"
 
-    # Get unique industries
-    unique_industries = list(set(all_industries))[:4]
+    # Top industries by frequency - deterministic, unlike slicing a set
+    unique_industries = [
+        industry for industry, _ in Counter(all_industries).most_common(4)
+    ]
 
     result = PerceptionAnalysis(
         evokes=evokes_summary,
@@ -345,29 +613,37 @@ def _evaluate_mission_alignment(
 ) -> dict:
     """Evaluate how well the name aligns with the mission."""
 
-    prompt = f"""Evaluate how well the brand name "{name}" aligns with this company mission:
-
-Mission: {mission}
+    # The mission is the stable part across names; cache it so repeated
+    # alignment checks (e.g. /compare batches) skip re-prefilling it
+    prefix = f"""Evaluate how well brand names align with this company mission:
 
-The name evokes: {evokes}
+Mission: {mission}"""
 
-Rate the alignment from 1-10 and explain briefly.
+    question = f"""Brand name: "{name}"
 
-Respond in JSON format:
-{{
-    "score": <1-10>,
-    "explanation": "<2-3 sentences>"
-}}
+The name evokes: {evokes}
 
-Respond ONLY with valid JSON."""
+Rate the alignment with the record_alignment tool."""
 
     try:
         response = client.messages.create(
-            model="claude-opus-4-5-20251101",
-            max_tokens=200,
-            messages=[{"role": "user", "content": prompt}],
+            model=SYNTHESIS_MODEL,
+            max_tokens=100,
+            tools=[_ALIGNMENT_TOOL],
+            tool_choice={"type": "tool", "name": "record_alignment"},
+            messages=[{
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": prefix,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {"type": "text", "text": question},
+                ],
+            }],
         )
-        return json.loads(response.content[0].text)
+        return _tool_input(response, "record_alignment")
     except Exception:
         return {"score": 5.0, "explanation": "Unable to evaluate alignment."}
 
@@ -386,7 +662,7 @@ def analyze_two_pass(
 
     The delta between expectation and reality is the key signal.
     """
-    client = Anthropic()
+    client = _get_client()
 
     # Use provided personas or defaults
     if personas is None:
@@ -455,20 +731,12 @@ Respond ONLY with valid JSON."""
 
     try:
         response = client.messages.create(
-            model="claude-opus-4-5-20251101",
+            model=PERSONA_MODEL,
             max_tokens=600,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        text = response.content[0].text.strip()
-        # Handle markdown code blocks
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-            text = text.strip()
-
-        result = json.loads(text)
+        result = _parse_json_object(response.content[0].text)
 
         return TwoPassResponse(
             persona=persona["name"],
@@ -1,5 +1,6 @@
 """Tests for the brand name oracle."""
 
+import os
 from unittest.mock import patch
 from namecast.evaluator import BrandEvaluator, EvaluationResult
 
@@ -92,6 +93,33 @@ class TestDomainChecker:
         assert result[".com"] is False
 
 
+class TestWhoisCache:
+    """Tests for the whois_lookup TTL cache."""
+
+    @patch.dict(os.environ, {"NAMECAST_DISK_CACHE": "0"})
+    @patch("namecast.evaluator._whois_lookup_uncached")
+    def test_repeated_lookups_hit_cache(self, mock_uncached):
+        """A second lookup of the same domain should not re-query WHOIS."""
+        from namecast.evaluator import whois_lookup, _whois_cache
+        _whois_cache.clear()
+        mock_uncached.return_value = {"domain_name": "cached.com", "creation_date": None}
+        first = whois_lookup("cached.com")
+        second = whois_lookup("cached.com")
+        assert first == second
+        assert mock_uncached.call_count == 1
+
+    @patch.dict(os.environ, {"NAMECAST_DISK_CACHE": "0"})
+    @patch("namecast.evaluator._whois_lookup_uncached")
+    def test_negative_results_are_cached(self, mock_uncached):
+        """Unregistered (None) answers should be cached too."""
+        from namecast.evaluator import whois_lookup, _whois_cache
+        _whois_cache.clear()
+        mock_uncached.return_value = None
+        assert whois_lookup("free-name.com") is None
+        assert whois_lookup("free-name.com") is None
+        assert mock_uncached.call_count == 1
+
+
 class TestSocialChecker:
     """Tests for social media handle checking."""
 
@@ -189,6 +217,30 @@ class TestInternationalChecker:
         assert len(issues) == 0
 
 
+class TestSimilarCompanies:
+    """Tests for the static similar-companies prefilter."""
+
+    def test_find_similar_static_returns_result(self):
+        """_find_similar_static() should return a SimilarCompaniesResult."""
+        from namecast.evaluator import SimilarCompaniesResult
+        evaluator = BrandEvaluator()
+        result = evaluator._find_similar_static("Lyfe")
+        assert isinstance(result, SimilarCompaniesResult)
+
+    def test_flags_near_identical_names(self):
+        """Names nearly identical to known companies should be flagged."""
+        evaluator = BrandEvaluator()
+        result = evaluator._find_similar_static("Stripee")
+        assert any(m.name.lower() == "stripe" for m in result.matches)
+        assert result.confusion_risk in ["medium", "high"]
+
+    def test_distinct_names_have_low_risk(self):
+        """Clearly distinct names should carry low confusion risk."""
+        evaluator = BrandEvaluator()
+        result = evaluator._find_similar_static("Quixotl")
+        assert result.confusion_risk == "low"
+
+
 class TestAIPerception:
     """Tests for AI-powered perception analysis."""
 